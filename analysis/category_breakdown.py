@@ -16,14 +16,10 @@ def category_breakdown_analysis(data, selected_brands):
         st.warning("No data found for the selected brands and categories.")
         return
 
-    # Calculate sales and cost by category
-    filtered_data['total_sales'] = filtered_data['sellingPrice'] * filtered_data['quantity']
-    filtered_data['total_cost'] = filtered_data['costPrice'] * filtered_data['quantity']
-
-    # Aggregate total_sales, total_cost, and quantity by categoryName
+    # Aggregate sales, cost (the revenue/cost line totals precomputed at load) and quantity by categoryName
     category_sales = filtered_data.groupby('categoryName').agg(
-        total_sales=('total_sales', 'sum'),
-        total_cost=('total_cost', 'sum'),
+        total_sales=('revenue', 'sum'),
+        total_cost=('cost', 'sum'),
         total_quantity=('quantity', 'sum')
     ).reset_index()
 
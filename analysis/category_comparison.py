@@ -9,7 +9,7 @@ def category_comparison_analysis(data, selected_categories):
     filtered_data = data[data['categoryName'].isin(selected_categories)]
 
     # Group by categoryName and calculate total sales
-    category_comparison = (filtered_data.groupby('categoryName')['sellingPrice']
+    category_comparison = (filtered_data.groupby('categoryName', observed=True)['sellingPrice']
                            .sum()
                            .sort_values(ascending=False)
                            .reset_index())
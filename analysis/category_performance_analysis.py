@@ -5,13 +5,9 @@ import plotly.express as px
 def category_performance_analysis(filtered_data, selected_categories, selected_stores):
     st.markdown("<h1 style='text-align: center; color: green;'>Category Performance Analysis</h1>", unsafe_allow_html=True)
 
-    # Calculate total selling and cost prices for the filtered data
-    filtered_data['total_selling_price'] = filtered_data['sellingPrice'] * filtered_data['quantity']
-    filtered_data['total_cost_price'] = filtered_data['costPrice'] * filtered_data['quantity']
-
-    # Calculate overall total sales and profit based on the filtered data
-    overall_total_selling_price = filtered_data['total_selling_price'].sum()
-    overall_total_cost_price = filtered_data['total_cost_price'].sum()
+    # Calculate overall total sales and profit based on the filtered data (revenue/cost line totals are precomputed at load)
+    overall_total_selling_price = filtered_data['revenue'].sum()
+    overall_total_cost_price = filtered_data['cost'].sum()
     overall_profit = overall_total_selling_price - overall_total_cost_price
 
     # Filter data for selected categories and stores
@@ -19,10 +15,10 @@ def category_performance_analysis(filtered_data, selected_categories, selected_s
 
     # Aggregate the data based on each unique categoryName and brandName
     aggregated_data = (
-        filtered_data.groupby(['categoryName', 'brandName'], as_index=False)
+        filtered_data.groupby(['categoryName', 'brandName'], as_index=False, observed=True)
         .agg(
-            total_selling_price=('total_selling_price', 'sum'),
-            total_cost_price=('total_cost_price', 'sum'),
+            total_selling_price=('revenue', 'sum'),
+            total_cost_price=('cost', 'sum'),
             total_quantity=('quantity', 'sum'),
             store_count=('storeName', 'nunique')
         )
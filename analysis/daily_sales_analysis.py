@@ -1,4 +1,3 @@
-import pandas as pd
 import plotly.express as px
 import streamlit as st
 
@@ -8,13 +7,14 @@ def daily_sales_analysis(filtered_data, selected_categories, selected_stores):
     # Filter data based on selected categories
     daily_sales_data = filtered_data[filtered_data['categoryName'].isin(selected_categories)]
     
-    # Aggregate daily sales for each category
-    daily_sales_data['orderDate'] = pd.to_datetime(daily_sales_data['orderDate'])
-    daily_sales = daily_sales_data.groupby([daily_sales_data['orderDate'].dt.date, 'categoryName']).agg(
-        total_sales=('sellingPrice', lambda x: (x * daily_sales_data.loc[x.index, 'quantity']).sum()),
+    # Aggregate daily sales for each category (date and the revenue/cost line totals are precomputed at load)
+    daily_sales = daily_sales_data.groupby(['date', 'categoryName'], observed=True).agg(
+        total_sales=('revenue', 'sum'),
         total_quantity=('quantity', 'sum'),
-        total_cost=('costPrice', lambda x: (x * daily_sales_data.loc[x.index, 'quantity']).sum())
-    ).reset_index()
+        total_cost=('cost', 'sum')
+    ).reset_index().rename(columns={'date': 'orderDate'})
+    # Plain dates, so the table shows no 00:00:00 time part
+    daily_sales['orderDate'] = daily_sales['orderDate'].dt.date
 
     # Add profit calculation: total sales minus total cost
     daily_sales['profit'] = daily_sales['total_sales'] - daily_sales['total_cost']
@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 
 def hourly_sales_analysis(data, selected_categories):
@@ -7,15 +6,11 @@ def hourly_sales_analysis(data, selected_categories):
 
     # Filter data for selected categories from main.py input
     filtered_data = data[data['categoryName'].isin(selected_categories)]
-    
-    # Extract hour from the time column and calculate total selling price and cost price
-    filtered_data['hour'] = filtered_data['time'].apply(lambda x: x.hour if pd.notnull(x) else None)
-    filtered_data['total_selling_price'] = filtered_data['sellingPrice'] * filtered_data['quantity']
-    filtered_data['total_cost_price'] = filtered_data['costPrice'] * filtered_data['quantity']
-    
-    hourly_sales = filtered_data.groupby(['categoryName', 'hour']).agg(
-        total_selling_price=('total_selling_price', 'sum'),
-        total_cost_price=('total_cost_price', 'sum'),
+
+    # hour and the revenue/cost line totals are precomputed at load
+    hourly_sales = filtered_data.groupby(['categoryName', 'hour'], observed=True).agg(
+        total_selling_price=('revenue', 'sum'),
+        total_cost_price=('cost', 'sum'),
         quantity=('quantity', 'sum')
     ).reset_index()
 
@@ -25,7 +20,8 @@ def hourly_sales_analysis(data, selected_categories):
         columns='hour', 
         values='total_selling_price', 
         aggfunc='sum', 
-        fill_value=0
+        fill_value=0,
+        observed=True
     ).reset_index()
 
     # Display the pivoted data (category-wise hourly sales)
@@ -80,8 +76,8 @@ def hourly_sales_analysis(data, selected_categories):
 
     # Aggregated hourly sales data (with 24 columns for each hour)
     total_hourly_sales = filtered_data.groupby('hour').agg(
-        total_selling_price=('total_selling_price', 'sum'),
-        total_cost_price=('total_cost_price', 'sum'),
+        total_selling_price=('revenue', 'sum'),
+        total_cost_price=('cost', 'sum'),
         quantity=('quantity', 'sum')
     ).reset_index()
 
@@ -13,13 +13,9 @@ def profit_margin_analysis(data, selected_categories):
     filtered_data['costPrice'] = pd.to_numeric(filtered_data['costPrice'], errors='coerce')
     filtered_data['quantity'] = pd.to_numeric(filtered_data['quantity'], errors='coerce')
 
-    # Calculate total selling price and total cost price by multiplying by quantity
-    filtered_data['total_sellingPrice'] = filtered_data['sellingPrice'] * filtered_data['quantity']
-    filtered_data['total_costPrice'] = filtered_data['costPrice'] * filtered_data['quantity']
-
-    # Group by categoryName and sum the total sellingPrice and total costPrice
-    category_grouped = (filtered_data.groupby('categoryName')
-                        .agg({'total_sellingPrice': 'sum', 'total_costPrice': 'sum'})
+    # Group by categoryName and sum the revenue/cost line totals (precomputed at load) as total sellingPrice and total costPrice
+    category_grouped = (filtered_data.groupby('categoryName', observed=True)
+                        .agg(total_sellingPrice=('revenue', 'sum'), total_costPrice=('cost', 'sum'))
                         .reset_index())
 
     # Calculate average profit margin based on summed values
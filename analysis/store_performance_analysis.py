@@ -11,22 +11,19 @@ def store_performance_analysis(data, date_filtered_data, selected_categories, se
     st.markdown("<h1 style='text-align: center; color: green;'>Stores Performance</h1>", unsafe_allow_html=True)
 
     # Calculate sales for all categories by store (using entire data, not just filtered data)
-    all_categories_store_sales = date_filtered_data.groupby('storeName').agg(
-        total_store_sales=('sellingPrice', lambda x: (x * date_filtered_data.loc[x.index, 'quantity']).sum())
+    all_categories_store_sales = date_filtered_data.groupby('storeName', observed=True).agg(
+        total_store_sales=('revenue', 'sum')
     ).reset_index()
 
     # Filter data for selected categories
     filtered_data = data[data['categoryName'].isin(selected_categories)]
-    filtered_data['total_selling_price'] = filtered_data['sellingPrice'] * filtered_data['quantity']
-    filtered_data['total_cost_price'] = filtered_data['costPrice'] * filtered_data['quantity']
-    filtered_data['profit'] = filtered_data['total_selling_price'] - filtered_data['total_cost_price']
 
     # Filter data for selected stores
     filtered_data = filtered_data[filtered_data['storeName'].isin(selected_stores)]
 
-    # Aggregate data by storeName for filtered data
-    store_performance = filtered_data.groupby('storeName').agg(
-        total_selling_price=('total_selling_price', 'sum'),
+    # Aggregate data by storeName for filtered data (revenue and profit line totals are precomputed at load)
+    store_performance = filtered_data.groupby('storeName', observed=True).agg(
+        total_selling_price=('revenue', 'sum'),
         total_quantity=('quantity', 'sum'),
         profit=('profit', 'sum'),
     ).reset_index()
@@ -12,19 +12,16 @@ def top_products_analysis(data, selected_categories):
     filtered_data['profit'] = filtered_data['sellingPrice'] - filtered_data['costPrice']
     filtered_data['profit_margin'] = (filtered_data['profit'] / filtered_data['sellingPrice']) * 100
 
-    # Calculate total selling price and cost by multiplying with quantity
-    filtered_data['total_selling_price'] = filtered_data['sellingPrice'] * filtered_data['quantity']
-    filtered_data['total_cost_price'] = filtered_data['costPrice'] * filtered_data['quantity']
-
     # Group by productId, productName, categoryName, and brandName to calculate total sales, profit, cost, and quantity
-    top_products = (filtered_data.groupby(['productId', 'productName', 'categoryName', 'brandName'])
-                    .agg({
-                        'total_selling_price': 'sum', 
-                        'total_cost_price': 'sum',
-                        'profit': 'sum', 
-                        'profit_margin': 'mean', 
-                        'quantity': 'sum'
-                    })
+    # (sales and cost from the revenue/cost line totals precomputed at load)
+    top_products = (filtered_data.groupby(['productId', 'productName', 'categoryName', 'brandName'], observed=True)
+                    .agg(
+                        total_selling_price=('revenue', 'sum'),
+                        total_cost_price=('cost', 'sum'),
+                        profit=('profit', 'sum'),
+                        profit_margin=('profit_margin', 'mean'),
+                        quantity=('quantity', 'sum')
+                    )
                     .sort_values(by='total_selling_price', ascending=False)
                     .reset_index())
 
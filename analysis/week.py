@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+from utils.data_loader import DAY_NAMES
 
 def weekly_sales_analysis(data, selected_brands_sidebar, top_brands):
     st.markdown("<h1 style='text-align: center; color: green;'>Weekly Sales</h1>", unsafe_allow_html=True)
@@ -25,26 +26,18 @@ def weekly_sales_analysis(data, selected_brands_sidebar, top_brands):
         st.warning("No sales data available for the selected brands.")
         return
 
-    # Extract the day of the week and month from orderDate
-    filtered_data['day'] = filtered_data['orderDate'].dt.day_name()
+    # Day of the week from the precomputed dow column, month from orderDate
+    filtered_data['day'] = filtered_data['dow'].map(dict(enumerate(DAY_NAMES)))
     filtered_data['month'] = filtered_data['orderDate'].dt.month_name()
 
-    # Calculate total selling price by multiplying sellingPrice with quantity
-    filtered_data['total_selling_price'] = filtered_data['sellingPrice'] * filtered_data['quantity']
-    filtered_data['total_cost_price'] = filtered_data['costPrice'] * filtered_data['quantity']
-
     # Aggregate sales data based on brand, month, and dynamic week label
-    filtered_data['month_year'] = filtered_data['orderDate'].dt.to_period('M') 
-    filtered_data['week_number'] = filtered_data.groupby('month_year')['orderDate'].transform(
-        lambda x: (x.dt.day - 1) // 7 + 1 
-    )
-    filtered_data['week_label'] = 'Week ' + filtered_data['week_number'].astype(str)
+    filtered_data['week_label'] = 'Week ' + filtered_data['month_week'].astype(str)
     
     weekly_sales_by_week = (
-        filtered_data.groupby(['month', 'brandName', 'week_label'], as_index=False)
+        filtered_data.groupby(['month', 'brandName', 'week_label'], as_index=False, observed=True)
         .agg(
-            total_selling_price=('total_selling_price', 'sum'),
-            total_cost_price=('total_cost_price', 'sum'),
+            total_selling_price=('revenue', 'sum'),
+            total_cost_price=('cost', 'sum'),
             total_quantity=('quantity', 'sum'),
             category_count=('categoryName', 'nunique')
         )
@@ -56,7 +49,8 @@ def weekly_sales_analysis(data, selected_brands_sidebar, top_brands):
         index=['month', 'brandName'],
         columns='week_label',
         values='total_selling_price',
-        fill_value=0
+        fill_value=0,
+        observed=True
     ).reset_index()
 
     # Calculate weekly sales growth percentage
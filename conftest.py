@@ -0,0 +1 @@
+# Root conftest so a plain `pytest` run puts the repo root on sys.path and tests can import utils/analysis
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('numba')
+pytest.importorskip('pyarrow')
+pytest.importorskip('streamlit')
+
+from utils.dashboard import LOADED_COLUMNS, build_columns, filter_data, filter_indices
+
+GROUPS = ['Bakery', 'Dairy', 'Snacks', None]
+STORES = ['Store A', 'Store B', 'Store C', None]
+
+
+def make_data(n_rows=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    # Whole hours over ten days, so some rows fall exactly on the midnight the end date parses to
+    order_dates = pd.Series(pd.Timestamp('2024-02-01', tz='UTC') + pd.to_timedelta(rng.integers(0, 240, n_rows), unit='h'))
+    order_dates[rng.random(n_rows) < 0.05] = pd.NaT
+    data = pd.DataFrame({
+        'orderDate': order_dates,
+        'categoryName': pd.Categorical(rng.choice(GROUPS, n_rows)),
+        'storeName': pd.Categorical(rng.choice(STORES, n_rows)),
+    })
+    # Same row order as the loader: sorted by orderDate, NaT last
+    return data.sort_values('orderDate', kind='mergesort').reset_index(drop=True)
+
+
+def baseline_filter(data, groups, stores, start_date, end_date):
+    # The boolean mask filter_data replaced
+    mask = (data['orderDate'] >= pd.to_datetime(start_date, utc=True)) & \
+           (data['orderDate'] <= pd.to_datetime(end_date, utc=True)) & \
+           (data['categoryName'].isin(groups)) & (data['storeName'].isin(stores))
+    return data[mask]
+
+
+@pytest.mark.parametrize('groups, stores, start_date, end_date', [
+    (('Bakery', 'Dairy', 'Snacks'), ('Store A', 'Store B', 'Store C'), '2024-02-01', '2024-02-10'),
+    (('Dairy',), ('Store B', 'Store C'), '2024-02-03', '2024-02-05'),
+    (('Snacks', 'Unknown'), ('Store A', 'Unknown'), '2024-02-02', '2024-02-02'),
+    (('Unknown',), ('Store A',), '2024-02-01', '2024-02-10'),
+    (('Bakery',), ('Store A',), '2024-03-01', '2024-03-05'),
+])
+def test_filter_data_matches_boolean_mask(groups, stores, start_date, end_date):
+    data = make_data()
+    fingerprint = ('test', len(data))
+    LOADED_COLUMNS[(fingerprint, 'categoryName')] = build_columns(data, 'categoryName')
+    filter_indices.cache_clear()
+
+    expected = baseline_filter(data, groups, stores, pd.to_datetime(start_date), pd.to_datetime(end_date))
+    filtered = filter_data(data, fingerprint, 'categoryName', groups, stores,
+                           pd.to_datetime(start_date), pd.to_datetime(end_date))
+
+    assert filtered.index.tolist() == expected.index.tolist()
@@ -0,0 +1,34 @@
+import io
+
+import pytest
+
+pytest.importorskip('numba')
+pytest.importorskip('pyarrow')
+pytest.importorskip('streamlit')
+
+from utils.data_loader import load_data, parse_time_dynamic
+
+CSV = (
+    "orderDate,time,categoryName,storeName,brandName,productName,quantity,sellingPrice,costPrice\n"
+    "01/02/2024,10:15:00,Snacks,Store A,Brand A,Chips,2,10.0,6.0\n"
+    "02/02/2024,,Snacks,Store A,Brand A,Chips,1,10.0,6.0\n"
+)
+
+
+def test_parse_time_dynamic_blank():
+    assert parse_time_dynamic(None) is None
+
+
+def test_load_data_blank_time_cell():
+    data = load_data(io.BytesIO(CSV.encode()))
+    assert data['time'].iloc[0].hour == 10
+    assert data['time'].iloc[1] is None
+    assert data['hour'].isna().tolist() == [False, True]
+
+
+def test_load_data_float_quantity():
+    # pandas' to_csv writes an integer column that has any NaN as 2.0
+    csv = CSV.replace(",2,10.0", ",2.0,10.0").replace(",1,10.0", ",,10.0")
+    data = load_data(io.BytesIO(csv.encode()))
+    assert data['quantity'].dtype == 'int32'
+    assert data['quantity'].tolist() == [2, 0]
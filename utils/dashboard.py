@@ -0,0 +1,213 @@
+import functools
+import streamlit as st
+import pandas as pd
+import numpy as np
+from utils.data_loader import load_cached_data, file_digest
+
+# Copy-on-write so slices handed to the analyses can never write back into the shared frame
+pd.set_option('mode.copy_on_write', True)
+
+# Load and preprocess data. cache_resource hands every rerun the same frame instead of a pickled copy,
+# so nothing downstream may mutate it in place. Keyed on the content digest rather than the hashed upload
+@st.cache_resource
+def load_optimized_data(_file, digest):
+    return load_cached_data(_file, digest)
+
+# Hot filter columns as plain numpy arrays (struct of arrays), built once per upload. All of them
+# are zero-copy views of the loaded frame, so the filter path never goes through the pandas BlockManager
+def build_columns(data, group_col):
+    return {
+        'orderDate': data['orderDate'].values,
+        'group_codes': data[group_col].cat.codes.to_numpy(),
+        'store_codes': data['storeName'].cat.codes.to_numpy(),
+        'group_levels': data[group_col].cat.categories,
+        'store_levels': data['storeName'].cat.categories,
+    }
+
+# Filter columns of every loaded upload, keyed by (fingerprint, group_col) and registered by run_dashboard.
+# Module level rather than session state, so filter_indices' process-wide cache depends only on its arguments
+LOADED_COLUMNS = {}
+
+# Row bounds of the date range in the orderDate-sorted data: two binary searches instead of a full-column mask
+def date_bounds(cols, start_date, end_date):
+    order_dates = cols['orderDate']
+    lo = 0 if start_date is None else np.searchsorted(order_dates, pd.to_datetime(start_date, utc=True).to_datetime64(), side='left')
+    hi = len(order_dates) if end_date is None else np.searchsorted(order_dates, pd.to_datetime(end_date, utc=True).to_datetime64(), side='right')
+    return lo, hi
+
+# Boolean mask of rows whose label is in values: one lookup-table gather over the integer codes.
+# The extra trailing slot stays False and absorbs the -1 code of missing labels
+def isin_codes(codes, levels, values):
+    positions = levels.get_indexer(list(values))
+    lookup = np.zeros(len(levels) + 1, dtype=bool)
+    lookup[positions[positions >= 0]] = True
+    return lookup[codes]
+
+# Row indices inside the date range whose group and store are selected. Only the int index array is kept
+# per cache entry, and hits return it as is (st.cache_data would pickle and copy it on every hit)
+@functools.lru_cache(maxsize=32)
+def filter_indices(fingerprint, group_col, groups, stores, start_date, end_date):
+    cols = LOADED_COLUMNS[(fingerprint, group_col)]
+    lo, hi = date_bounds(cols, start_date, end_date)
+    mask = isin_codes(cols['group_codes'][lo:hi], cols['group_levels'], groups)
+    mask &= isin_codes(cols['store_codes'][lo:hi], cols['store_levels'], stores)
+
+    indices = lo + np.flatnonzero(mask)
+    # Shared by every later hit on this key
+    indices.flags.writeable = False
+    return indices
+
+# Rows inside the date range whose group and store are selected, gathered from the cached indices
+def filter_data(data, fingerprint, group_col, groups, stores, start_date, end_date):
+    return data.iloc[filter_indices(fingerprint, group_col, groups, stores, start_date, end_date)]
+
+# Find the date range once and derive both views from it: the whole date slice and its group/store
+# filtered subset (orderDate is already UTC and sorted by the loader).
+# Filtering works on the numpy columns; the analyses get pandas frames gathered from the filtered rows
+def prepare_views(data, cols, fingerprint, group_col, groups, stores, start_date, end_date):
+    lo, hi = date_bounds(cols, start_date, end_date)
+    date_filtered_data = data.iloc[lo:hi]
+    filtered_data = filter_data(data, fingerprint, group_col, groups, stores, start_date, end_date)
+
+    return filtered_data, date_filtered_data
+
+# Labels of a column ordered by row count, computed once per dataset so any top-N is just a slice
+# (keyed on the data fingerprint; hashing the whole frame costs more than value_counts)
+@st.cache_resource
+def value_order(_data, column, fingerprint):
+    return _data[column].value_counts().index.to_numpy()
+
+# Top N labels of a column
+def get_top_values(data, column, fingerprint, n=10):
+    return value_order(data, column, fingerprint)[:n].tolist()
+
+# Shared dashboard: upload, sidebar filters and analyses, grouped by group_col (e.g. categoryName or brandName).
+# analyses is a list of (title, analysis) pairs; each analysis is called with a dict of the views: data,
+# filtered_data, date_filtered_data, selected_groups, top_groups and selected_stores
+def run_dashboard(group_col, analyses, page_title="Category Analysis Dashboard", group_label="categories"):
+    # Page configuration
+    st.set_page_config(page_title=page_title, layout="wide")
+
+    # Initialize session state
+    if 'data' not in st.session_state:
+        st.session_state.data = None
+        st.session_state.last_upload = None
+        st.session_state.data_fingerprint = None
+        st.session_state.cols = None
+
+    # Sidebar layout
+    with st.sidebar:
+        uploaded_file = st.file_uploader("Upload CSV file", type="csv")
+
+        if uploaded_file:
+            if st.session_state.last_upload != uploaded_file.name:
+                with st.spinner('Loading data...'):
+                    digest = file_digest(uploaded_file)
+                    st.session_state.data = load_optimized_data(uploaded_file, digest)
+                    st.session_state.last_upload = uploaded_file.name
+                    # Content hash + row count identifies the dataset in cache keys, even across same-named uploads
+                    st.session_state.data_fingerprint = (digest, len(st.session_state.data))
+                    st.session_state.cols = build_columns(st.session_state.data, group_col)
+                st.success("Data loaded successfully!")
+
+            data = st.session_state.data
+            cols = st.session_state.cols
+            fingerprint = st.session_state.data_fingerprint
+            # Registered on every rerun so the entry survives a reload of this module
+            LOADED_COLUMNS[(fingerprint, group_col)] = cols
+
+            min_date = data['orderDate'].min()
+            max_date = data['orderDate'].max()
+
+            col1, col2 = st.columns(2)
+            with col1:
+                start_date = st.date_input("Start Date", min_date)
+            with col2:
+                end_date = st.date_input("End Date", max_date)
+
+            start_date = pd.to_datetime(start_date)
+            end_date = pd.to_datetime(end_date)
+
+            # Get the number of unique groups in the data (already held by the categorical dtype, no scan needed)
+            unique_groups = data[group_col].cat.categories
+            n_groups_available = len(unique_groups)
+
+            # Slider to select top N groups, affecting all analyses by default
+            n_groups = st.number_input(
+                f"Select number of top {group_label} to analyze",
+                min_value=1,
+                max_value=n_groups_available,
+                value=min(250, n_groups_available),
+                step=1
+            )
+
+            # Get top groups based on the selected N
+            top_groups = get_top_values(data, group_col, fingerprint, n=n_groups)
+
+            # Multiselect for narrowing down to specific groups within the top N
+            selected_groups_sidebar = st.multiselect(
+                f"Select {group_label} for analysis",
+                options=top_groups
+            )
+
+            # Get the number of unique stores in the data
+            unique_stores = data['storeName'].cat.categories
+            n_stores_available = len(unique_stores)
+
+            # Get top stores based on the selected N (for store filter)
+            top_stores = get_top_values(data, 'storeName', fingerprint, n=n_stores_available)
+
+            # Multiselect for narrowing down to specific stores within the top N stores
+            selected_stores_sidebar = st.multiselect(
+                "Select stores for analysis",
+                options=top_stores
+            )
+
+    # Ensure that top_groups, selected_groups_sidebar, top_stores, and selected_stores_sidebar are defined before using them
+    if uploaded_file:
+        # Use selected groups and stores from the sidebar if any are chosen, otherwise default to top groups and stores
+        selected_groups = selected_groups_sidebar if selected_groups_sidebar else top_groups
+        selected_stores = selected_stores_sidebar if selected_stores_sidebar else top_stores
+
+        # Filter data based on selected groups, stores, and date range. Sorted tuples make equal
+        # selections equal cache keys whatever order they were picked in
+        filtered_data, date_filtered_data = prepare_views(
+            data, cols, fingerprint, group_col,
+            tuple(sorted(selected_groups)), tuple(sorted(selected_stores)), start_date, end_date
+        )
+
+        st.sidebar.markdown(f"**Data points:** {len(filtered_data):,}")
+
+        try:
+            with st.spinner('Analyzing data...'):
+                if len(filtered_data) > 0:
+                    views = {
+                        'data': data,
+                        'filtered_data': filtered_data,
+                        'date_filtered_data': date_filtered_data,
+                        'selected_groups': selected_groups,
+                        'top_groups': top_groups,
+                        'selected_stores': selected_stores,
+                    }
+
+                    # Only the chosen analysis runs on each rerun (st.tabs would still execute every tab's code);
+                    # "Run all" renders the whole page as before
+                    titles = [title for title, _ in analyses]
+                    run_all = st.sidebar.checkbox("Run all analyses", False, key="dashboard_run_all")
+                    if run_all:
+                        selected_titles = titles
+                    else:
+                        selected_titles = [st.sidebar.selectbox("Select analysis", titles, key="dashboard_analysis")]
+
+                    # Run the selected analyses with filtered_data based on selected groups, stores, or top groups/stores by default
+                    for title, analysis in analyses:
+                        if title in selected_titles:
+                            analysis(views)
+
+                else:
+                    st.warning("No data found for the selected criteria.")
+        except Exception as e:
+            st.error(f"An error occurred during analysis: {str(e)}")
+            st.exception(e)
+    else:
+        st.warning("Please upload a CSV file to begin analysis.")
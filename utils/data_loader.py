@@ -1,13 +1,118 @@
+import glob
+import hashlib
+import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
 import streamlit as st
+from numba import njit, prange
+
+# Feather copies of parsed uploads live here (repo-level cache/, whatever the working directory), keyed by file content
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache')
+# Bump whenever load_data changes the columns or dtypes it returns, so stale cache files are ignored
+CACHE_VERSION = 10
+# Weekday names for the dow column (0 = Monday, as Series.dt.dayofweek), fixed English whatever the process locale
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+# Label columns stored as pandas category dtype; group by these with observed=True
+CATEGORICAL_COLUMNS = ('categoryName', 'storeName', 'brandName', 'productName')
+# Explicit CSV column types. quantity is read as float64 because pandas writes an integer column holding NaN
+# as '2.0', which an int32 column type rejects; load_data narrows it to int32. Prices stay float64 because the
+# analyses display values derived from them directly, and float32 noise would show up in the tables. Labels are
+# dictionary-encoded while parsing, and orderDate/time stay strings for the dayfirst/multi-format parsing below
+CSV_COLUMN_TYPES = {
+    'quantity': pa.float64(),
+    'sellingPrice': pa.float64(),
+    'costPrice': pa.float64(),
+    'orderDate': pa.string(),
+    'time': pa.string(),
+    **{column: pa.dictionary(pa.int32(), pa.string()) for column in CATEGORICAL_COLUMNS},
+}
 
 def load_data(uploaded_file):
-    data = pd.read_csv(uploaded_file)
-    data['orderDate'] = pd.to_datetime(data['orderDate'], errors='coerce', dayfirst=True)
+    # Arrow's multi-threaded reader parses the CSV; self_destruct frees Arrow buffers as pandas takes them over
+    # strings_can_be_null keeps empty fields missing, as pandas' reader did, instead of turning them into ''
+    convert_options = pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES, strings_can_be_null=True)
+    table = pacsv.read_csv(uploaded_file, convert_options=convert_options)
+    data = table.to_pandas(self_destruct=True)
+    del table
+    # Missing quantities come back as float NaN; they contributed nothing to any sum, so store them as 0
+    data['quantity'] = data['quantity'].fillna(0).astype('int32')
+    # Parse orderDate to UTC once so the filters never have to re-coerce it
+    data['orderDate'] = pd.to_datetime(data['orderDate'], errors='coerce', dayfirst=True, utc=True)
     data['time'] = data['time'].apply(parse_time_dynamic)
+    # Calendar keys derived once here instead of inside the daily/weekly/hourly analyses on every rerun
+    # (nullable Int8 so rows without a date or time keep a missing key, which groupby drops as before)
+    data['date'] = data['orderDate'].dt.floor('D').dt.tz_localize(None)
+    data['dow'] = data['orderDate'].dt.dayofweek.astype('Int8')
+    data['month_week'] = ((data['orderDate'].dt.day - 1) // 7 + 1).astype('Int8')
+    data['hour'] = data['time'].map(lambda x: x.hour if pd.notnull(x) else None).astype('Int8')
+    # Labels arrive as categoricals (integer codes, so isin/groupby/value_counts skip string hashing) with
+    # categories in order of first appearance; sort them so grouped output stays alphabetical
+    for column in CATEGORICAL_COLUMNS:
+        data[column] = data[column].cat.reorder_categories(data[column].cat.categories.sort_values())
+    # Line totals computed once, so aggregations are plain column sums instead of per-group lambdas.
+    # float64 like the prices, so summed totals match what sellingPrice * quantity gave
+    n_rows = len(data)
+    revenue = np.empty(n_rows, dtype=np.float64)
+    cost = np.empty(n_rows, dtype=np.float64)
+    profit = np.empty(n_rows, dtype=np.float64)
+    compute_revenue_cost_profit(
+        data['sellingPrice'].to_numpy(), data['costPrice'].to_numpy(), data['quantity'].to_numpy(),
+        revenue, cost, profit
+    )
+    data['revenue'] = revenue
+    data['cost'] = cost
+    data['profit'] = profit
+    # Keep rows in orderDate order so date-range filters can binary-search instead of masking.
+    # mergesort is stable, so same-day rows keep their CSV order and tie-broken outputs stay deterministic
+    data = data.sort_values('orderDate', kind='mergesort').reset_index(drop=True)
+    return data
+
+# Fills revenue, cost and profit for every row in one parallel pass instead of three column operations
+@njit(parallel=True, cache=True)
+def compute_revenue_cost_profit(selling_price, cost_price, quantity, revenue, cost, profit):
+    for i in prange(selling_price.shape[0]):
+        row_revenue = selling_price[i] * quantity[i]
+        row_cost = cost_price[i] * quantity[i]
+        revenue[i] = row_revenue
+        cost[i] = row_cost
+        profit[i] = row_revenue - row_cost
+
+def file_digest(uploaded_file):
+    return hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
+
+# Remove cache files written by other CACHE_VERSIONs; they can never be read again
+def remove_stale_cache_files(cache_dir=CACHE_DIR):
+    for stale_path in glob.glob(os.path.join(cache_dir, '*.feather')):
+        if not stale_path.endswith(f".v{CACHE_VERSION}.feather"):
+            try:
+                os.remove(stale_path)
+            except FileNotFoundError:
+                pass
+
+# digest is file_digest(uploaded_file), passed in so callers that also need it only hash the upload once
+def load_cached_data(uploaded_file, digest, cache_dir=CACHE_DIR):
+    path = os.path.join(cache_dir, f"{digest}.v{CACHE_VERSION}.feather")
+    if os.path.exists(path):
+        # Memory-mapped Arrow read; self_destruct frees Arrow buffers as pandas takes them over
+        return feather.read_table(path, memory_map=True).to_pandas(self_destruct=True)
+
+    data = load_data(uploaded_file)
+
+    # Write to a temp file first so a concurrent session never reads a half-written cache
+    os.makedirs(cache_dir, exist_ok=True)
+    remove_stale_cache_files(cache_dir)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    feather.write_feather(data, tmp_path, compression='zstd')
+    os.replace(tmp_path, path)
     return data
 
 def parse_time_dynamic(time_str):
+    # Blank cells arrive as None (strings_can_be_null); pd.to_datetime(None) returns None, which has no .time()
+    if pd.isna(time_str):
+        return None
     try:
         return pd.to_datetime(time_str, format='%H:%M:%S.%fZ').time()
     except ValueError: